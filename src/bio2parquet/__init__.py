@@ -3,7 +3,9 @@
 Convert common bioinformatics file formats to parquet.
 """
 
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
 __all__ = (
     "Bio2ParquetError",
@@ -13,16 +15,45 @@ __all__ = (
     "create_dataset_from_fasta",
     "main",
     "print_error",
+    "read_fasta_batches",
     "read_fasta_file",
 )
 
+if TYPE_CHECKING:
+    from bio2parquet.cli import main
+    from bio2parquet.errors import Bio2ParquetError, FileProcessingError, InvalidFormatError, print_error
+    from bio2parquet.fasta import create_dataset_from_fasta, read_fasta_batches, read_fasta_file
 
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    # package is not installed
-    __version__ = "0.0.0.dev0"  # Fallback version
+# Public names and the submodule defining them. Submodules pull in click, datasets and pyarrow,
+# so they are only imported when one of their names is first accessed.
+_LAZY_ATTRIBUTES = {
+    "Bio2ParquetError": "bio2parquet.errors",
+    "FileProcessingError": "bio2parquet.errors",
+    "InvalidFormatError": "bio2parquet.errors",
+    "create_dataset_from_fasta": "bio2parquet.fasta",
+    "main": "bio2parquet.cli",
+    "print_error": "bio2parquet.errors",
+    "read_fasta_batches": "bio2parquet.fasta",
+    "read_fasta_file": "bio2parquet.fasta",
+}
 
-from bio2parquet.cli import main
-from bio2parquet.errors import Bio2ParquetError, FileProcessingError, InvalidFormatError, print_error
-from bio2parquet.fasta import create_dataset_from_fasta, read_fasta_file
+
+def __getattr__(name: str) -> Any:
+    # Resolve the version lazily: reading the package metadata is only worth it when asked for.
+    if name == "__version__":
+        try:
+            version = importlib.metadata.version(__name__)
+        except importlib.metadata.PackageNotFoundError:
+            # package is not installed
+            version = "0.0.0.dev0"  # Fallback version
+        globals()["__version__"] = version
+        return version
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
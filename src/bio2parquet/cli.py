@@ -3,17 +3,44 @@
 This module provides the CLI for converting bioinformatics files to Parquet format.
 """
 
+import contextlib
+import errno
+import functools
+import os
+import stat
 import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, ParamSpec, TypeVar
 
 import click
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bio2parquet.errors import Bio2ParquetError, print_error
+from bio2parquet.fasta import FASTA_ROW_GROUP_SIZE, FASTA_SCHEMA, dataset_from_table, iter_fasta_batches
 
 if TYPE_CHECKING:
     from datasets import Dataset
 
-from bio2parquet.errors import Bio2ParquetError, print_error
-from bio2parquet.fasta import create_dataset_from_fasta
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+_FASTA_SUFFIXES = (".fasta", ".fa", ".fna", ".fasta.gz", ".fa.gz", ".fna.gz")
+# Headers often share prefixes (e.g. chromosome names) and benefit from dictionary encoding,
+# while sequences are mostly unique and are left to the compression codec.
+_PARQUET_WRITE_OPTIONS = {
+    "use_dictionary": ["header"],
+    "write_statistics": True,
+    "data_page_size": 2 << 20,
+    "dictionary_pagesize_limit": 1 << 20,
+}
+_COMPRESSION_CODECS = ("zstd", "snappy", "gzip", "brotli", "lz4", "none")
+_DEFAULT_COMPRESSION_LEVELS = {"zstd": 3}
+_EMPTY_DATASET_MESSAGE = (
+    "The FASTA file seems to be empty or could not be parsed correctly, resulting in an empty dataset."
+)
 
 
 def _handle_empty_dataset(dataset: "Dataset") -> None:
@@ -25,10 +52,8 @@ def _handle_empty_dataset(dataset: "Dataset") -> None:
     Raises:
         Bio2ParquetError: If the dataset is empty
     """
-    if len(dataset) == 0:
-        raise Bio2ParquetError(
-            "The FASTA file seems to be empty or could not be parsed correctly, resulting in an empty dataset.",
-        )
+    if dataset.num_rows == 0:
+        raise Bio2ParquetError(_EMPTY_DATASET_MESSAGE)
 
 
 def _validate_fasta_extension(filepath: Path) -> None:
@@ -40,10 +65,9 @@ def _validate_fasta_extension(filepath: Path) -> None:
     Raises:
         click.BadParameter: If file extension is not valid
     """
-    valid_extensions = (".fasta", ".fa", ".fna", ".fasta.gz", ".fa.gz", ".fna.gz")
-    if not filepath.name.endswith(valid_extensions):
+    if not filepath.name.lower().endswith(_FASTA_SUFFIXES):
         raise click.BadParameter(
-            f"Input file must be a FASTA file with one of these extensions: {', '.join(valid_extensions)}",
+            f"Input file must be a FASTA file with one of these extensions: {', '.join(_FASTA_SUFFIXES)}",
             param_hint="fasta_file",
         )
 
@@ -63,6 +87,128 @@ def _get_output_path(input_file: Path, output_file: Optional[Path]) -> Path:
     return output_file
 
 
+def _get_parquet_write_options(compression: str, compression_level: Optional[int]) -> dict[str, Any]:
+    """Builds the keyword arguments passed to the Parquet writer.
+
+    Args:
+        compression: The compression codec, or "none"
+        compression_level: Optional codec-specific compression level
+
+    Returns:
+        The Parquet writer options
+
+    Raises:
+        click.BadParameter: If a level is given for a codec that does not support one,
+            or is out of the codec's range
+    """
+    if compression_level is not None and (
+        compression == "none" or not pa.Codec.supports_compression_level(compression)
+    ):
+        raise click.BadParameter(
+            f"Compression codec '{compression}' does not support setting a compression level.",
+            param_hint="--compression-level",
+        )
+    if compression_level is not None:
+        minimum = pa.Codec.minimum_compression_level(compression)
+        maximum = pa.Codec.maximum_compression_level(compression)
+        if not minimum <= compression_level <= maximum:
+            raise click.BadParameter(
+                f"Compression level for '{compression}' must be between {minimum} and {maximum}.",
+                param_hint="--compression-level",
+            )
+    if compression_level is None:
+        compression_level = _DEFAULT_COMPRESSION_LEVELS.get(compression)
+    return {**_PARQUET_WRITE_OPTIONS, "compression": compression, "compression_level": compression_level}
+
+
+def _get_new_file_mode(output_path: Path) -> int:
+    """Returns the permissions the output file would get from a direct write.
+
+    Args:
+        output_path: The resolved output file path
+
+    Returns:
+        The mode of the existing output file, or the default mode for new files under
+        the current umask
+    """
+    with contextlib.suppress(FileNotFoundError):
+        return stat.S_IMODE(os.stat(output_path).st_mode)
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextlib.contextmanager
+def _atomic_output(output_path: Path) -> Iterator[Path]:
+    """Yields a temporary path that replaces the output file once the block succeeds.
+
+    The temporary file has a unique name next to the output so the final rename stays
+    on one filesystem and concurrent conversions don't collide. If the block raises,
+    the temporary file is removed and any existing output file is left untouched.
+    Like a direct write, a symlinked output is written through, a read-only output is
+    refused and an existing output keeps its permissions.
+
+    Args:
+        output_path: The final output file path
+
+    Yields:
+        The temporary path to write to
+
+    Raises:
+        PermissionError: If the output file exists and is not writable
+    """
+    output_path = output_path.resolve()
+    if output_path.exists() and not os.access(output_path, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), str(output_path))
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{output_path.name}.", suffix=".tmp", dir=output_path.parent)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, _get_new_file_mode(output_path))
+        os.replace(tmp_path, output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _convert_to_parquet(
+    input_path: Path,
+    output_path: Path,
+    reader_fn: Callable[[Path], Iterator[pa.RecordBatch]],
+    write_options: dict[str, Any],
+    *,
+    row_group_size: Optional[int] = None,
+) -> None:
+    """Streams record batches from a parser straight into a Parquet file.
+
+    The whole input is never held in memory and no `datasets` cache is written. The
+    output file only appears once the last batch is written, so a parse error part-way
+    through the input never leaves a truncated Parquet file behind.
+
+    Args:
+        input_path: The input file path
+        output_path: The output Parquet file path
+        reader_fn: Function yielding the record batches of the input file
+        write_options: Options passed to the Parquet writer
+        row_group_size: Maximum number of rows per row group
+
+    Raises:
+        Bio2ParquetError: If the input yields no records
+    """
+    batches = reader_fn(input_path)
+    first_batch = next(batches, None)
+    if first_batch is None:
+        raise Bio2ParquetError(_EMPTY_DATASET_MESSAGE)
+
+    with (
+        _atomic_output(output_path) as tmp_path,
+        pq.ParquetWriter(tmp_path, first_batch.schema, **write_options) as writer,
+    ):
+        writer.write_batch(first_batch, row_group_size=row_group_size)
+        for batch in batches:
+            writer.write_batch(batch, row_group_size=row_group_size)
+
+
 def _handle_hf_upload(dataset: "Dataset", repo_id: str, token: Optional[str]) -> None:
     """Handles uploading the dataset to Hugging Face Hub.
 
@@ -92,6 +238,9 @@ def _process_fasta_file(
     output_file: Optional[Path],
     hf_token: Optional[str],
     hf_repo_id: Optional[str],
+    *,
+    compression: str = "zstd",
+    compression_level: Optional[int] = None,
 ) -> None:
     """Process a FASTA file and convert it to Parquet format.
 
@@ -100,6 +249,8 @@ def _process_fasta_file(
         output_file: Optional path to the output Parquet file
         hf_token: Optional Hugging Face token
         hf_repo_id: Optional Hugging Face repository ID
+        compression: Parquet compression codec, or "none"
+        compression_level: Optional compression level, defaults to the codec's own (3 for zstd)
 
     Raises:
         Bio2ParquetError: If there's an error processing the file
@@ -109,15 +260,56 @@ def _process_fasta_file(
     _validate_fasta_extension(fasta_file)
     click.echo(f"Processing FASTA file: {fasta_file}")
 
-    dataset: Dataset = create_dataset_from_fasta(fasta_file)
+    output_path = _get_output_path(fasta_file, output_file)
+    write_options = _get_parquet_write_options(compression, compression_level)
+
+    if not hf_repo_id:
+        _convert_to_parquet(
+            fasta_file,
+            output_path,
+            iter_fasta_batches,
+            write_options,
+            row_group_size=FASTA_ROW_GROUP_SIZE,
+        )
+        click.echo(f"Successfully converted to Parquet: {output_path}")
+        return
+
+    table = pa.Table.from_batches(list(iter_fasta_batches(fasta_file)), schema=FASTA_SCHEMA)
+    dataset = dataset_from_table(table)
     _handle_empty_dataset(dataset)
 
-    output_path = _get_output_path(fasta_file, output_file)
-    dataset.to_parquet(output_path)
+    with _atomic_output(output_path) as tmp_path:
+        pq.write_table(table, tmp_path, row_group_size=FASTA_ROW_GROUP_SIZE, **write_options)
     click.echo(f"Successfully converted to Parquet: {output_path}")
 
-    if hf_repo_id:
-        _handle_hf_upload(dataset, hf_repo_id, hf_token)
+    _handle_hf_upload(dataset, hf_repo_id, hf_token)
+
+
+def _cli_error_boundary(command: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Decorator reporting errors raised by a command and exiting with the matching code.
+
+    Args:
+        command: The command callback to wrap
+
+    Returns:
+        The wrapped command callback
+    """
+
+    @functools.wraps(command)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        try:
+            return command(*args, **kwargs)
+        except Bio2ParquetError as e:
+            print_error(e)
+            sys.exit(1)
+        except click.ClickException as e:
+            e.show()
+            sys.exit(e.exit_code)
+        except RuntimeError as e:
+            print_error(e)
+            sys.exit(1)
+
+    return wrapper
 
 
 @click.group()
@@ -149,27 +341,42 @@ def main() -> None:
     "--hf-repo-id",
     help="Hugging Face Hub repository ID to push the dataset to (e.g., 'username/my_fasta_dataset'). Requires --hf-token.",
 )
+@click.option(
+    "--compression",
+    type=click.Choice(_COMPRESSION_CODECS, case_sensitive=False),
+    default="zstd",
+    show_default=True,
+    help="Parquet compression codec. 'snappy' trades file size for less CPU time on constrained machines.",
+)
+@click.option(
+    "--compression-level",
+    type=int,
+    help="Compression level for codecs that support one. Defaults to 3 for zstd and to the codec's default otherwise.",
+)
+@_cli_error_boundary
 def fasta(
     fasta_file: Path,
     output_file: Optional[Path],
     hf_token: Optional[str],
     hf_repo_id: Optional[str],
+    *,
+    compression: str,
+    compression_level: Optional[int],
 ) -> None:
     """Converts a FASTA file to Parquet format.
 
     FASTA_FILE: Path to the input FASTA file (.fasta or .fasta.gz).
+
+    The Parquet file is zstd-compressed by default and its header column is dictionary-encoded.
     """
-    try:
-        _process_fasta_file(fasta_file, output_file, hf_token, hf_repo_id)
-    except Bio2ParquetError as e:
-        print_error(e)
-        sys.exit(1)
-    except click.ClickException as e:
-        e.show()
-        sys.exit(e.exit_code)
-    except RuntimeError as e:
-        print_error(e)
-        sys.exit(1)
+    _process_fasta_file(
+        fasta_file,
+        output_file,
+        hf_token,
+        hf_repo_id,
+        compression=compression.lower(),
+        compression_level=compression_level,
+    )
 
 
 if __name__ == "__main__":
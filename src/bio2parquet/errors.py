@@ -1,10 +1,14 @@
 """Custom error classes and error handling utilities for bio2parquet."""
 
+import functools
 import traceback
+from typing import TYPE_CHECKING, Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Longest __cause__ chain printed by print_error.
+_MAX_CAUSE_DEPTH = 10
 
 
 class Bio2ParquetError(Exception):
@@ -25,6 +29,10 @@ class FileProcessingError(Bio2ParquetError):
         self.filepath = filepath
         super().__init__(f"Error processing file '{filepath}': {message}")
 
+    def __reduce__(self) -> tuple[type, tuple[str, str]]:
+        # Rebuild from the original arguments so the error survives pickling across worker processes.
+        return (type(self), (self.message, self.filepath))
+
 
 class InvalidFormatError(Bio2ParquetError):
     """Exception raised for invalid file formats."""
@@ -40,28 +48,60 @@ class InvalidFormatError(Bio2ParquetError):
         self.filepath = filepath
         super().__init__(f"Invalid format in file '{filepath}': {message}")
 
+    def __reduce__(self) -> tuple[type, tuple[str, str]]:
+        # Rebuild from the original arguments so the error survives pickling across worker processes.
+        return (type(self), (self.message, self.filepath))
 
-def print_error(exception: BaseException) -> None:
-    """Prints a formatted error message and traceback using Rich.
 
-    Args:
-        exception: The exception to print.
+@functools.cache
+def _get_console() -> "Console":
+    """Returns the shared stderr console, importing Rich on first use.
+
+    The console resolves sys.stderr when printing, not at construction, so a
+    single instance is safe to reuse.
+
+    Returns:
+        The Rich console used to print errors.
     """
-    console = Console(stderr=True)
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console(stderr=True)
 
-    error_message = Text(f"An error occurred: {exception!s}\n", style="bold red")
 
-    tb_str = traceback.format_exc()
-    traceback_panel = Panel(
-        Text(tb_str, style="dim white"),
-        title="[bold yellow]Error Traceback[/bold yellow]",
-        border_style="red",
-        expand=False,
-    )
+def print_error(exception: BaseException) -> None:
+    """Prints a formatted error message and traceback using Rich.
 
-    console.print(error_message)
-    console.print(traceback_panel)
+    Each exception in the ``__cause__`` chain is printed with its own traceback,
+    up to ``_MAX_CAUSE_DEPTH`` levels.
 
-    if hasattr(exception, "__cause__") and exception.__cause__:
-        console.print("\n[bold yellow]Underlying Cause:[/bold yellow]")
-        print_error(exception.__cause__)
+    Args:
+        exception: The exception to print.
+    """
+    # Rich is only imported once an error actually has to be shown
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.text import Text  # noqa: PLC0415
+
+    console = _get_console()
+    current: Optional[BaseException] = exception
+    seen: set[int] = set()
+    depth = 0
+    while current is not None and id(current) not in seen and depth < _MAX_CAUSE_DEPTH:
+        if depth:
+            console.print("\n[bold yellow]Underlying Cause:[/bold yellow]")
+        seen.add(id(current))
+
+        error_message = Text(f"An error occurred: {current!s}\n", style="bold red")
+
+        tb_str = "".join(traceback.format_exception(type(current), current, current.__traceback__, chain=False))
+        traceback_panel = Panel(
+            Text(tb_str, style="dim white"),
+            title="[bold yellow]Error Traceback[/bold yellow]",
+            border_style="red",
+            expand=False,
+        )
+
+        console.print(error_message)
+        console.print(traceback_panel)
+
+        current = current.__cause__
+        depth += 1
@@ -1,16 +1,73 @@
-"""FASTA file processing and conversion to Parquet datasets."""
+"""FASTA file processing and conversion to Parquet datasets.
 
+The public API is listed in `__all__` and re-exported by the package.
+`FASTA_SCHEMA`, `FASTA_ROW_GROUP_SIZE`, `iter_fasta_batches` and
+`dataset_from_table` are internal API shared with the CLI: they skip the input
+checks that click already performs, and may change without notice.
+"""
+
+import contextlib
+import errno
+import functools
 import gzip
-from collections.abc import Iterator
+import importlib
+import io
+import itertools
+import os
+import queue
+import stat
+import threading
+from collections.abc import Generator, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, TextIO
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, Union
 
-from Bio import SeqIO
-from datasets import Dataset, Features, Value
+import pyarrow as pa
 
 from bio2parquet.errors import FileProcessingError, InvalidFormatError
 
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+    from datasets import Dataset
+
+__all__ = ("create_dataset_from_fasta", "read_fasta_batches", "read_fasta_file")
+
+try:
+    # ISA-L's SIMD inflate is a drop-in for gzip and decompresses several times faster.
+    _gzip: ModuleType = importlib.import_module("isal.igzip")
+except ImportError:
+    _gzip = gzip
+
+try:
+    # rapidgzip decompresses a single gzip stream on several cores, which pays off on large archives.
+    _rapidgzip: Optional[ModuleType] = importlib.import_module("rapidgzip")
+except ImportError:
+    _rapidgzip = None
+
+FASTA_SCHEMA = pa.schema([("header", pa.string()), ("sequence", pa.large_string())])
+# Sequences range from short reads to whole chromosomes: a few rows per Parquet row group
+# keeps row groups small enough for random access even when each cell is megabytes long.
+FASTA_ROW_GROUP_SIZE = 1024
+# A multiple of the row group size, so batches never leave a short row group behind.
+_BATCH_SIZE = 10 * FASTA_ROW_GROUP_SIZE
+_HEADER_BYTE = ord(">")
+# Bytes read up front to validate the file and detect its line endings.
+_SNIFF_SIZE = 64 * 1024
+# Large read buffer for plain files: fewer read syscalls on big sequential inputs.
+_READ_BUFFER_SIZE = 1 << 20
+# Read compressed inputs in 128 KiB blocks, like CPython's gzip.READ_BUFFER_SIZE.
+_GZIP_READ_BUFFER_SIZE = 128 * 1024
+# Decompressed chunks read ahead by the gzip prefetch thread: up to 4 x 1 MiB in flight.
+_PREFETCH_CHUNK_SIZE = 1 << 20
+_PREFETCH_QUEUE_SIZE = 4
+# Compressed size above which gzipped inputs are decompressed in parallel with rapidgzip.
+_PARALLEL_GZIP_MIN_SIZE = 32 * 1024 * 1024
+# Smallest byte range worth handing to a worker process when parsing in parallel.
+_MIN_PARALLEL_RANGE_SIZE = 1 << 20
+# Largest byte range handed to a worker process, so its memory doesn't grow with the file.
+_MAX_PARALLEL_RANGE_SIZE = 64 * 1024 * 1024
+
 
 def _validate_file_exists(filepath: Path) -> None:
     """Validates that the file exists and is a file.
@@ -19,30 +76,55 @@ def _validate_file_exists(filepath: Path) -> None:
         filepath: Path to validate
 
     Raises:
-        FileProcessingError: If file doesn't exist or isn't a file
+        FileProcessingError: If file doesn't exist, can't be accessed or isn't a file
     """
-    if not filepath.exists():
-        raise FileProcessingError(f"Input file does not exist: {filepath}", str(filepath))
-    if not filepath.is_file():
+    try:
+        file_stat = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileProcessingError(f"Input file does not exist: {filepath}", str(filepath)) from None
+    except OSError as e:
+        if e.errno == errno.ELOOP:
+            raise FileProcessingError(f"Input file does not exist: {filepath}", str(filepath)) from None
+        raise FileProcessingError(f"Cannot access input file {filepath}: {e.strerror}", str(filepath)) from e
+    if not stat.S_ISREG(file_stat.st_mode):
         raise FileProcessingError(f"Input path is not a file: {filepath}", str(filepath))
 
 
-def _validate_fasta_content(handle: TextIO, filepath: Path) -> None:
+def _is_gzipped(filepath: Path) -> bool:
+    """Tells whether a FASTA file is gzipped, from its extension.
+
+    Args:
+        filepath: Path to the FASTA file.
+
+    Returns:
+        True if the file name ends with '.gz', in any case.
+    """
+    return filepath.suffix.lower() == ".gz"
+
+
+def _validate_fasta_content(handle: BinaryIO, filepath: Path) -> bytes:
     """Validates the initial content of a FASTA file.
 
+    Only a bounded prefix is read, since a file without LF line endings has no
+    line to stop at. The prefix is returned so the caller can parse it without
+    rewinding (a rewind restarts gzip decompression).
+
     Args:
         handle: File handle to validate
         filepath: Path to the file being validated
 
+    Returns:
+        Up to the first 64 KiB of the file.
+
     Raises:
         InvalidFormatError: If file is empty or doesn't start with a header
     """
-    first_line = handle.readline()
-    if first_line == "":
-        _raise_invalid_format_error("File is empty: no FASTA records found.", str(filepath))
-    if not first_line.strip().startswith(">"):
-        _raise_invalid_format_error("Sequence data found before a header line", str(filepath))
-    handle.seek(0)
+    prefix = handle.read(_SNIFF_SIZE)
+    if not prefix:
+        raise InvalidFormatError("File is empty: no FASTA records found.", str(filepath))
+    if not prefix.startswith(b">"):
+        raise InvalidFormatError("Sequence data found before a header line", str(filepath))
+    return prefix
 
 
 def _validate_record(record: Any, filepath: Path) -> None:
@@ -56,59 +138,369 @@ def _validate_record(record: Any, filepath: Path) -> None:
         InvalidFormatError: If record is invalid
     """
     if not record.seq:
-        _raise_invalid_format_error("Sequence missing for header.", str(filepath))
+        raise InvalidFormatError("Sequence missing for header.", str(filepath))
     if not record.id:
-        _raise_invalid_format_error("Header missing for sequence.", str(filepath))
+        raise InvalidFormatError("Header missing for sequence.", str(filepath))
+
 
+def _make_record(title: bytes, sequence: bytearray, filepath: Path) -> tuple[str, str]:
+    """Builds and validates a FASTA record from its header line and sequence lines.
 
-def _raise_invalid_format_error(message: str, filepath_str: str) -> None:
-    """Raises an InvalidFormatError with the given message.
+    Follows Bio.SeqIO: the header is the first word of the title line, and
+    spaces, tabs and carriage returns are dropped from the sequence. Lines are kept as
+    bytes and only decoded once per record.
 
     Args:
-        message: The error message
-        filepath_str: The filepath as a string
+        title: The header line, without the leading '>'
+        sequence: The sequence lines of the record, concatenated
+        filepath: Path to the file being processed
+
+    Returns:
+        The header and the sequence of the record.
 
     Raises:
-        InvalidFormatError: Always raises this exception
+        InvalidFormatError: If record is invalid
     """
-    raise InvalidFormatError(message, filepath_str)
+    # Lines are right-stripped already: bytes.translate is a per-byte loop, so only
+    # rebuild the sequence when stray whitespace is left
+    if b" " in sequence or b"\t" in sequence or b"\r" in sequence:
+        sequence = sequence.translate(None, b" \t\r")
+    text = sequence.decode("utf-8")
+    if not text:
+        raise InvalidFormatError("Sequence missing for header.", str(filepath))
+    words = title.split(None, 1)
+    if not words:
+        raise InvalidFormatError("Header missing for sequence.", str(filepath))
+    return words[0].decode("utf-8"), text
+
+
+def _iter_fasta(lines: Iterable[bytes], filepath: Path) -> Iterator[tuple[str, str]]:
+    """Parses FASTA records from an iterable of raw lines.
 
+    Args:
+        lines: The non-empty lines of the FASTA file
+        filepath: Path to the file being processed
 
-def read_fasta_file(filepath: Path) -> Iterator[dict[str, str]]:
-    """Reads a FASTA file and yields records as dictionaries.
+    Yields:
+        A (header, sequence) tuple for each record.
 
-    Handles both .fasta and .fasta.gz files using Bio.SeqIO for efficient parsing.
-    Validates file format and content before processing.
+    Raises:
+        InvalidFormatError: If a record is invalid
+    """
+    title: Optional[bytes] = None
+    # One buffer reused across records instead of a list of lines joined per record
+    sequence = bytearray()
+    for line in lines:
+        # Lines read from a file are never empty; comparing their first byte is
+        # cheaper than calling startswith on every line
+        if line[0] == _HEADER_BYTE:
+            if title is not None:
+                yield _make_record(title, sequence, filepath)
+            title = line[1:].rstrip()
+            sequence.clear()
+        else:
+            sequence += line.rstrip()
+    if title is not None:
+        yield _make_record(title, sequence, filepath)
+
+
+def _has_bare_cr(prefix: bytes) -> bool:
+    """Tells whether a file uses classic Mac OS line endings, from its first bytes.
+
+    Binary reads only split lines on LF, so carriage returns without any line
+    feed mean the input uses bare CR line endings.
+
+    Args:
+        prefix: The first bytes of the file
+
+    Returns:
+        True if the prefix contains a carriage return but no line feed.
+    """
+    return b"\r" in prefix and b"\n" not in prefix
+
+
+def _iter_universal_lines(prefix: bytes, handle: BinaryIO) -> Iterator[bytes]:
+    """Splits a binary stream on LF, CRLF and bare CR line endings, like text mode does.
+
+    Only used for inputs with bare CR line endings: the stream is read in large
+    blocks and split with `bytes.splitlines`. A line spanning several blocks is
+    kept as a list of parts and joined once.
+
+    Args:
+        prefix: The first bytes of the file, already consumed by validation
+        handle: File handle positioned just after the prefix
+
+    Yields:
+        The lines of the file, line endings included.
+    """
+    pending: list[bytes] = []
+    blocks = itertools.chain((prefix,), iter(functools.partial(handle.read, _READ_BUFFER_SIZE), b""))
+    for block in blocks:
+        # Split after the last line ending, unless it is a final CR whose LF may come next
+        end = max(block.rfind(b"\n"), block.rfind(b"\r", 0, len(block) - 1)) + 1
+        if not end:
+            pending.append(block)
+            continue
+        pending.append(block[:end])
+        yield from b"".join(pending).splitlines(keepends=True)
+        pending = [block[end:]] if end < len(block) else []
+    yield from b"".join(pending).splitlines(keepends=True)
+
+
+def _iter_lines(prefix: bytes, handle: BinaryIO) -> Iterator[bytes]:
+    """Splits a binary stream into lines, after a prefix already read from it.
+
+    Lines are split on LF, like iterating over the handle does. Inputs with bare
+    CR line endings are split by `_iter_universal_lines` instead.
+
+    Args:
+        prefix: The first bytes of the file, already consumed by validation
+        handle: File handle positioned just after the prefix
+
+    Yields:
+        The lines of the file, line endings included.
+    """
+    if _has_bare_cr(prefix):
+        yield from _iter_universal_lines(prefix, handle)
+        return
+    lines = io.BytesIO(prefix).readlines()
+    if not lines[-1].endswith(b"\n"):
+        # The prefix stops mid-line: finish that line from the handle
+        lines[-1] += handle.readline()
+    yield from lines
+    yield from handle
+
+
+def _iter_biopython_records(filepath: Path) -> Iterator[tuple[str, str]]:
+    """Parses FASTA records with Bio.SeqIO.
+
+    Args:
+        filepath: Path to the FASTA file, already validated
+
+    Yields:
+        A (header, sequence) tuple for each record.
+
+    Raises:
+        InvalidFormatError: If a record is invalid
+    """
+    # Imported lazily: Biopython is only needed by this fallback parser
+    from Bio import SeqIO  # noqa: PLC0415
+
+    with io.TextIOWrapper(_open_fasta(filepath), encoding="utf-8") as text_handle:
+        for record in SeqIO.parse(text_handle, "fasta"):
+            _validate_record(record, filepath)
+            yield record.id, str(record.seq)
+
+
+class _PrefetchReader(io.RawIOBase):
+    """Reads a binary stream ahead of its consumer in a background thread.
+
+    Inflating releases the GIL, so the next chunks of a gzipped file are
+    decompressed while the current ones are parsed. Errors raised by the
+    underlying stream are re-raised by `readinto`.
+    """
+
+    def __init__(self, handle: Union[BinaryIO, io.RawIOBase]):
+        """Initialize _PrefetchReader and start the reader thread.
+
+        Args:
+            handle: The stream to read ahead. It is closed with the reader.
+        """
+        super().__init__()
+        self._handle = handle
+        self._chunks: queue.Queue[Union[bytes, Exception]] = queue.Queue(maxsize=_PREFETCH_QUEUE_SIZE)
+        self._stopped = threading.Event()
+        self._pending = memoryview(b"")
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._produce, name="bio2parquet-prefetch", daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        # `close` drains the queue after setting _stopped, so a put blocked on a full
+        # queue returns at once and at most one more chunk is queued after that
+        try:
+            while chunk := self._handle.read(_PREFETCH_CHUNK_SIZE):
+                self._chunks.put(chunk)
+                if self._stopped.is_set():
+                    return
+            self._chunks.put(b"")
+        except Exception as e:  # noqa: BLE001
+            self._chunks.put(e)
+
+    def readable(self) -> bool:
+        """Returns True: the reader is readable.
+
+        Returns:
+            True.
+        """
+        return True
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        """Copies the next prefetched bytes into a buffer.
+
+        Args:
+            buffer: The buffer to fill.
+
+        Returns:
+            The number of bytes copied, 0 at the end of the stream.
+        """
+        if not self._pending:
+            if self._exhausted:
+                return 0
+            item = self._chunks.get()
+            if isinstance(item, Exception):
+                self._exhausted = True
+                raise item
+            if not item:
+                self._exhausted = True
+                return 0
+            self._pending = memoryview(item)
+        size = min(len(memoryview(buffer)), len(self._pending))
+        memoryview(buffer)[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        """Stops the reader thread and closes the underlying stream."""
+        if not self.closed:
+            self._stopped.set()
+            # Unblock a reader thread waiting on a full queue
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    self._chunks.get_nowait()
+            self._thread.join()
+            self._handle.close()
+        super().close()
+
+
+class _RapidgzipReader(io.RawIOBase):
+    """Reads a rapidgzip stream, reporting corrupt and truncated data like gzip does.
+
+    rapidgzip raises plain ValueError and RuntimeError on bad data, and decompresses
+    some truncated files to nothing at all. Its errors are raised as EOFError, and
+    an empty stream is read again with gzip, which tells an empty archive from a
+    truncated one.
+    """
+
+    def __init__(self, handle: io.BufferedIOBase, path_str: str):
+        """Initialize _RapidgzipReader.
+
+        Args:
+            handle: The rapidgzip stream. It is closed with the reader.
+            path_str: Path to the gzipped file, to reopen it with gzip.
+        """
+        super().__init__()
+        self._handle = handle
+        self._path_str = path_str
+        self._started = False
+
+    def readable(self) -> bool:
+        """Returns True: the reader is readable.
+
+        Returns:
+            True.
+        """
+        return True
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        """Decompresses the next bytes into a buffer.
+
+        Args:
+            buffer: The buffer to fill.
+
+        Returns:
+            The number of bytes copied, 0 at the end of the stream.
+
+        Raises:
+            EOFError: If the compressed data is corrupt or truncated.
+        """
+        try:
+            size = self._handle.readinto(buffer)
+        except (RuntimeError, ValueError) as e:
+            raise EOFError("Compressed file is corrupt or ended before the end-of-stream marker was reached") from e
+        if not size and not self._started:
+            self._handle.close()
+            self._handle = _gzip.open(self._path_str, "rb")
+            size = self._handle.readinto(buffer)
+        self._started = True
+        return size
+
+    def close(self) -> None:
+        """Closes the underlying stream."""
+        if not self.closed:
+            self._handle.close()
+        super().close()
+
+
+def _has_gzip_magic(path_str: str) -> bool:
+    """Tells whether a file starts with the gzip magic bytes.
+
+    Args:
+        path_str: Path to the file.
+
+    Returns:
+        True if the file starts with 1f 8b.
+    """
+    with open(path_str, "rb") as handle:
+        return handle.read(2) == b"\x1f\x8b"
+
+
+def _open_fasta(filepath: Path) -> BinaryIO:
+    """Opens a plain or gzipped FASTA file as a buffered binary stream.
+
+    Gzipped files are decompressed by a background thread, on all cores for large
+    files when rapidgzip is installed.
+
+    Args:
+        filepath: Path to the FASTA file.
+
+    Returns:
+        A binary handle over the decompressed content.
+    """
+    path_str = os.fspath(filepath)
+    if _is_gzipped(filepath):
+        if (
+            _rapidgzip is not None
+            and os.path.getsize(path_str) > _PARALLEL_GZIP_MIN_SIZE
+            # Leave files that aren't gzip at all to gzip, which raises BadGzipFile for them
+            and _has_gzip_magic(path_str)
+        ):
+            gz_handle: Union[BinaryIO, io.RawIOBase] = _RapidgzipReader(
+                _rapidgzip.open(path_str, parallelization=os.cpu_count() or 1),
+                path_str,
+            )
+        else:
+            gz_handle = _gzip.open(path_str, "rb")
+        return io.BufferedReader(_PrefetchReader(gz_handle), buffer_size=_GZIP_READ_BUFFER_SIZE)
+    return open(path_str, "rb", buffering=_READ_BUFFER_SIZE)
+
+
+def _parse_fasta_file(filepath: Path, *, use_biopython: bool = False) -> Iterator[tuple[str, str]]:
+    """Parses a FASTA file that is already known to exist.
 
     Args:
         filepath: Path to the FASTA file.
+        use_biopython: Whether to parse with Bio.SeqIO instead of the built-in parser.
 
     Yields:
-        A dictionary with 'header' and 'sequence' keys for each record.
+        A (header, sequence) tuple for each record.
 
     Raises:
         FileProcessingError: If the file cannot be read.
         InvalidFormatError: If the file is not in valid FASTA format.
     """
-    _validate_file_exists(filepath)
-
     try:
-        # Handle gzip files explicitly
-        if filepath.name.endswith(".gz"):
-            with gzip.open(filepath, "rt", encoding="utf-8") as handle:
-                _validate_fasta_content(handle, filepath)
-                for record in SeqIO.parse(handle, "fasta"):
-                    _validate_record(record, filepath)
-                    yield {"header": record.id, "sequence": str(record.seq)}
-        else:
-            with open(filepath, encoding="utf-8") as handle:
-                _validate_fasta_content(handle, filepath)
-                for record in SeqIO.parse(handle, "fasta"):
-                    _validate_record(record, filepath)
-                    yield {"header": record.id, "sequence": str(record.seq)}
+        with _open_fasta(filepath) as handle:
+            prefix = _validate_fasta_content(handle, filepath)
+            if not use_biopython:
+                yield from _iter_fasta(_iter_lines(prefix, handle), filepath)
+        if use_biopython:
+            # Bio.SeqIO reads from the start of the file, which the prefetched gzip stream
+            # cannot rewind to: reopen it once the validation handle and its thread are closed
+            yield from _iter_biopython_records(filepath)
     except FileNotFoundError:
         raise FileProcessingError(f"File not found: {filepath}", str(filepath)) from None
-    except gzip.BadGzipFile:
+    except (gzip.BadGzipFile, _gzip.BadGzipFile):
         raise FileProcessingError(f"File is not a valid GZIP file: {filepath}", str(filepath)) from None
     except InvalidFormatError:
         raise
@@ -116,56 +508,274 @@ def read_fasta_file(filepath: Path) -> Iterator[dict[str, str]]:
         raise FileProcessingError(f"Error reading file {filepath}: {e}", str(filepath)) from e
 
 
-def _process_chunk(chunk: list[dict[str, str]]) -> list[dict[str, str]]:
-    """Process a chunk of FASTA records in parallel.
+def read_fasta_file(
+    filepath: Union[str, Path],
+    *,
+    use_biopython: bool = False,
+) -> Generator[dict[str, str], None, None]:
+    """Reads a FASTA file and yields records as dictionaries.
+
+    Handles both .fasta and .fasta.gz files with a streaming parser that only builds
+    the header and sequence strings. Bio.SeqIO, which builds a full SeqRecord per
+    record, can be used instead. Validates file format and content before processing.
 
     Args:
-        chunk: List of FASTA records to process.
+        filepath: Path to the FASTA file.
+        use_biopython: Whether to parse with Bio.SeqIO instead of the built-in parser.
 
-    Returns:
-        Processed records.
+    Yields:
+        A dictionary with 'header' and 'sequence' keys for each record.
+
+    Raises:
+        FileProcessingError: If the file cannot be read.
+        InvalidFormatError: If the file is not in valid FASTA format.
     """
-    return chunk
+    filepath = Path(filepath)
+    _validate_file_exists(filepath)
+    for header, sequence in _parse_fasta_file(filepath, use_biopython=use_biopython):
+        yield {"header": header, "sequence": sequence}
 
 
-def create_dataset_from_fasta(filepath: Path, chunk_size: int = 1000, max_workers: Optional[int] = None) -> Dataset:
-    """Creates a Hugging Face Dataset from a FASTA file using parallel processing.
+def _batch_records(records: Iterable[tuple[str, str]], batch_size: int) -> Iterator[pa.RecordBatch]:
+    """Groups (header, sequence) tuples into Arrow record batches.
+
+    Args:
+        records: The records to group.
+        batch_size: Maximum number of records per batch.
+
+    Yields:
+        Record batches following `FASTA_SCHEMA`.
+    """
+    headers: list[str] = []
+    sequences: list[str] = []
+    for header, sequence in records:
+        headers.append(header)
+        sequences.append(sequence)
+        if len(headers) >= batch_size:
+            yield pa.RecordBatch.from_pydict({"header": headers, "sequence": sequences}, schema=FASTA_SCHEMA)
+            headers, sequences = [], []
+    if headers:
+        yield pa.RecordBatch.from_pydict({"header": headers, "sequence": sequences}, schema=FASTA_SCHEMA)
+
+
+def iter_fasta_batches(filepath: Path, batch_size: int = _BATCH_SIZE) -> Iterator[pa.RecordBatch]:
+    """Reads a FASTA file and yields its records as Arrow record batches.
+
+    The file is not checked for existence: this is meant for callers that already
+    validated the path, such as the CLI where click does it.
 
     Args:
         filepath: Path to the FASTA file.
-        chunk_size: Number of records to process in each chunk.
-        max_workers: Maximum number of worker processes. If None, uses CPU count.
+        batch_size: Maximum number of records per batch.
 
-    Returns:
-        A Hugging Face Dataset with 'header' and 'sequence' columns.
+    Yields:
+        Record batches following `FASTA_SCHEMA`.
 
     Raises:
-        FileProcessingError: If the input filepath does not exist or is not a file.
+        FileProcessingError: If the file cannot be read.
+        InvalidFormatError: If the file is not in valid FASTA format.
     """
+    yield from _batch_records(_parse_fasta_file(filepath), batch_size)
+
+
+def read_fasta_batches(
+    filepath: Union[str, Path],
+    *,
+    batch_size: int = _BATCH_SIZE,
+) -> Generator[pa.RecordBatch, None, None]:
+    """Reads a FASTA file and yields its records as Arrow record batches.
+
+    Unlike `read_fasta_file`, no dictionary is built per record: the batches can be
+    written to Parquet or assembled into a table directly.
+
+    Args:
+        filepath: Path to the FASTA file.
+        batch_size: Maximum number of records per batch.
+
+    Yields:
+        Record batches with a 'header' string column and a 'sequence' large_string column.
+
+    Raises:
+        FileProcessingError: If the file cannot be read.
+        InvalidFormatError: If the file is not in valid FASTA format.
+    """
+    filepath = Path(filepath)
     _validate_file_exists(filepath)
+    yield from iter_fasta_batches(filepath, batch_size)
+
+
+def _find_record_boundaries(filepath: Path, num_ranges: int) -> list[int]:
+    """Splits an uncompressed FASTA file into byte ranges that start on a header line.
+
+    Args:
+        filepath: Path to the FASTA file.
+        num_ranges: Number of ranges to aim for.
+
+    Returns:
+        Sorted offsets, starting at 0 and ending at the file size. Consecutive
+        offsets delimit one range; there may be fewer ranges than requested.
+    """
+    file_size = os.path.getsize(filepath)
+    boundaries = [0]
+    with open(filepath, "rb", buffering=_READ_BUFFER_SIZE) as handle:
+        for i in range(1, num_ranges):
+            offset = i * file_size // num_ranges
+            if offset <= boundaries[-1]:
+                continue
+            # Finish the line containing offset - 1, then move on to the next header line
+            handle.seek(offset - 1)
+            handle.readline()
+            position = handle.tell()
+            line = handle.readline()
+            while line and not line.startswith(b">"):
+                position = handle.tell()
+                line = handle.readline()
+            if not line:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    boundaries.append(file_size)
+    return boundaries
+
+
+def _iter_range_lines(handle: BinaryIO, size: int) -> Iterator[bytes]:
+    """Reads lines from a binary stream until a number of bytes has been consumed.
+
+    Args:
+        handle: File handle positioned at the start of the range
+        size: Size of the range, in bytes. The range must end on a line boundary.
+
+    Yields:
+        The lines of the range, line endings included.
+    """
+    for line in handle:
+        yield line
+        size -= len(line)
+        if size <= 0:
+            return
 
-    features = Features(
-        {
-            "header": Value("string"),
-            "sequence": Value("string"),
-        },
+
+def _parse_fasta_range(path_str: str, start: int, end: int) -> list[pa.RecordBatch]:
+    """Parses the records found in a byte range of an uncompressed FASTA file.
+
+    Runs in worker processes. The range must start on a header line. Lines are
+    streamed from the file, so only one batch of Python strings is alive at a time.
+
+    Args:
+        path_str: Path to the FASTA file.
+        start: Offset of the first byte of the range.
+        end: Offset just past the last byte of the range.
+
+    Returns:
+        The records of the range, as batches: Arrow buffers are much cheaper to send
+        back to the parent process than lists of Python strings.
+
+    Raises:
+        InvalidFormatError: If a record is invalid.
+    """
+    with open(path_str, "rb", buffering=_READ_BUFFER_SIZE) as handle:
+        handle.seek(start)
+        records = _iter_fasta(_iter_range_lines(handle, end - start), Path(path_str))
+        return list(_batch_records(records, _BATCH_SIZE))
+
+
+def _read_fasta_table_parallel(filepath: Path, max_workers: int) -> Optional[pa.Table]:
+    """Parses an uncompressed FASTA file in parallel, over byte ranges of at most 64 MiB.
+
+    Args:
+        filepath: Path to the FASTA file.
+        max_workers: Maximum number of worker processes.
+
+    Returns:
+        A table of all records, or None if the file is too small to be worth splitting,
+        has no record boundary to split on or uses bare CR line endings.
+
+    Raises:
+        FileProcessingError: If the file cannot be read.
+        InvalidFormatError: If the file is not in valid FASTA format.
+    """
+    file_size = os.path.getsize(filepath)
+    # At least one range per worker, and more on large files so each range stays bounded
+    num_ranges = min(
+        max(max_workers, -(-file_size // _MAX_PARALLEL_RANGE_SIZE)),
+        file_size // _MIN_PARALLEL_RANGE_SIZE,
     )
+    if num_ranges <= 1:
+        return None
 
-    # Read all records into memory (Bio.SeqIO is efficient for this)
-    records = list(read_fasta_file(filepath))
+    try:
+        with open(filepath, "rb") as handle:
+            prefix = _validate_fasta_content(handle, filepath)
+        if _has_bare_cr(prefix):
+            # Ranges are split on LF: leave bare CR line endings to the sequential parser
+            return None
+        boundaries = _find_record_boundaries(filepath, num_ranges)
+        if len(boundaries) - 1 <= 1:
+            # No header to split on, e.g. a single long chromosome: a lone worker would only
+            # add a process and a copy of the table to the streaming sequential path
+            return None
+        parse_range = functools.partial(_parse_fasta_range, os.fspath(filepath))
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(boundaries) - 1)) as executor:
+            batches = [
+                batch
+                for range_batches in executor.map(parse_range, boundaries[:-1], boundaries[1:])
+                for batch in range_batches
+            ]
+    except (FileProcessingError, InvalidFormatError):
+        raise
+    except Exception as e:
+        raise FileProcessingError(f"Error reading file {filepath}: {e}", str(filepath)) from e
+
+    return pa.Table.from_batches(batches, schema=FASTA_SCHEMA)
+
+
+def dataset_from_table(table: pa.Table) -> "Dataset":
+    """Wraps an in-memory Arrow table in a Hugging Face Dataset.
+
+    Without an explicit fingerprint, datasets pickles the whole table to hash it,
+    which more than triples peak memory on large files.
+
+    Args:
+        table: Table following `FASTA_SCHEMA`.
+
+    Returns:
+        A Hugging Face Dataset over the table, without copying it.
+    """
+    # `datasets` takes most of a second to import, so only pay for it when a Dataset is built
+    from datasets import Dataset  # noqa: PLC0415
+    from datasets.fingerprint import generate_random_fingerprint  # noqa: PLC0415
 
-    if not records:
-        return Dataset.from_dict({"header": [], "sequence": []}, features=features)
+    return Dataset(table, fingerprint=generate_random_fingerprint())
 
-    # Process records in parallel chunks
-    chunks = [records[i : i + chunk_size] for i in range(0, len(records), chunk_size)]
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        processed_chunks = list(executor.map(_process_chunk, chunks))
 
-    # Flatten the processed chunks
-    all_records = [record for chunk in processed_chunks for record in chunk]
+def create_dataset_from_fasta(
+    filepath: Union[str, Path],
+    chunk_size: int = 1000,  # noqa: ARG001
+    max_workers: Optional[int] = None,
+) -> "Dataset":
+    """Creates a Hugging Face Dataset from a FASTA file.
+
+    Args:
+        filepath: Path to the FASTA file.
+        chunk_size: Unused, kept for backward compatibility.
+        max_workers: Number of worker processes used to parse uncompressed files. By default,
+            and for gzipped files, records are parsed in a single process.
+
+    Returns:
+        A Hugging Face Dataset with 'header' and 'sequence' columns.
+
+    Raises:
+        FileProcessingError: If the input filepath does not exist or is not a file.
+    """
+    filepath = Path(filepath)
+    _validate_file_exists(filepath)
 
-    def gen() -> Iterator[dict[str, str]]:
-        yield from all_records
+    if max_workers is not None and max_workers > 1 and not _is_gzipped(filepath):
+        table = _read_fasta_table_parallel(filepath, max_workers)
+        if table is not None:
+            return dataset_from_table(table)
 
-    return Dataset.from_generator(gen, features=features)
+    # Only one batch of Python strings is alive at a time; the rest is held as Arrow buffers.
+    # Wrap the in-memory table: large_string sequences avoid the 2 GiB offset limit of long genomes
+    table = pa.Table.from_batches(iter_fasta_batches(filepath), schema=FASTA_SCHEMA)
+    return dataset_from_table(table)
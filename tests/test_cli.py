@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 from click.testing import CliRunner
 
 from bio2parquet._internal import debug
+from bio2parquet.cli import _atomic_output
 from bio2parquet.cli import main as cli_main
+from bio2parquet.errors import _MAX_CAUSE_DEPTH, print_error
 
 
 def test_main() -> None:
@@ -120,6 +124,189 @@ def test_fasta_command_success(runner: CliRunner, sample_fasta_file: Path, tmp_p
     assert sequences[1] == "GATTACAGATTACA"
 
 
+def test_fasta_command_writes_zstd_parquet(runner: CliRunner, sample_fasta_file: Path, tmp_path: Path) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(cli_main, ["fasta", str(sample_fasta_file), "-o", str(output_parquet)])
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    metadata = pq.ParquetFile(output_parquet).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD", "Parquet file should be zstd-compressed."
+    assert "RLE_DICTIONARY" in metadata.row_group(0).column(0).encodings, "Header column should be dictionary-encoded."
+    assert pq.read_schema(output_parquet).field("sequence").type == pa.large_string(), (
+        "Sequences should be large strings."
+    )
+
+
+def test_fasta_command_row_group_size(runner: CliRunner, tmp_path: Path) -> None:
+    fasta_file = tmp_path / "many.fasta"
+    fasta_file.write_text("".join(f">seq{i}\nACGT\n" for i in range(2500)))
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(cli_main, ["fasta", str(fasta_file), "-o", str(output_parquet)])
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    metadata = pq.ParquetFile(output_parquet).metadata
+    assert metadata.num_rows == 2500
+    assert metadata.num_row_groups == 3, "Row groups should hold at most 1024 records."
+
+
+def test_fasta_command_row_groups_span_batches(runner: CliRunner, tmp_path: Path) -> None:
+    fasta_file = tmp_path / "many.fasta"
+    fasta_file.write_text("".join(f">seq{i}\nACGT\n" for i in range(25000)))
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(cli_main, ["fasta", str(fasta_file), "-o", str(output_parquet)])
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    metadata = pq.ParquetFile(output_parquet).metadata
+    row_group_sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert row_group_sizes == [1024] * 24 + [424], "Only the last row group should be short."
+
+
+def test_fasta_command_late_parse_error_leaves_no_output(runner: CliRunner, tmp_path: Path) -> None:
+    fasta_file = tmp_path / "late_error.fasta"
+    fasta_file.write_text("".join(f">seq{i}\nACGT\n" for i in range(15000)) + ">broken\n")
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(cli_main, ["fasta", str(fasta_file), "-o", str(output_parquet)])
+
+    assert result.exit_code == 1
+    assert "Sequence missing for header" in result.output
+    assert not output_parquet.exists(), "A failed conversion should not leave a Parquet file behind."
+    assert list(tmp_path.iterdir()) == [fasta_file], "The temporary output file should be removed."
+
+
+def test_fasta_command_writes_through_symlinked_output(
+    runner: CliRunner,
+    sample_fasta_file: Path,
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "target.parquet"
+    target.write_bytes(b"old")
+    target.chmod(0o640)
+    output_parquet = tmp_path / "output.parquet"
+    output_parquet.symlink_to(target)
+    result = runner.invoke(cli_main, ["fasta", str(sample_fasta_file), "-o", str(output_parquet)])
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    assert output_parquet.is_symlink(), "The output symlink should be written through, not replaced."
+    assert pq.read_table(target).num_rows == 2
+    assert target.stat().st_mode & 0o777 == 0o640, "The existing output should keep its permissions."
+
+
+def test_atomic_output_read_only_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    output_parquet.write_bytes(b"old")
+    output_parquet.chmod(0o444)
+    # Root may write to read-only files: report the output as read-only whoever runs the tests
+    monkeypatch.setattr("bio2parquet.cli.os.access", lambda _path, mode: mode != os.W_OK)
+    with pytest.raises(PermissionError), _atomic_output(output_parquet) as tmp_output:
+        tmp_output.write_bytes(b"new")
+    assert output_parquet.read_bytes() == b"old", "A read-only output should not be replaced."
+
+
+def test_atomic_output_unique_temporary_files(tmp_path: Path) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    with _atomic_output(output_parquet) as first, _atomic_output(output_parquet) as second:
+        assert first != second, "Concurrent conversions to one output should not share a temporary file."
+        first.write_bytes(b"first")
+        second.write_bytes(b"second")
+    assert output_parquet.read_bytes() == b"first"
+    assert list(tmp_path.iterdir()) == [output_parquet], "The temporary output files should be removed."
+
+
+@pytest.mark.parametrize(("codec", "expected"), [("snappy", "SNAPPY"), ("gzip", "GZIP"), ("none", "UNCOMPRESSED")])
+def test_fasta_command_compression_option(
+    runner: CliRunner,
+    sample_fasta_file: Path,
+    tmp_path: Path,
+    codec: str,
+    expected: str,
+) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(
+        cli_main,
+        ["fasta", str(sample_fasta_file), "-o", str(output_parquet), "--compression", codec],
+    )
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    metadata = pq.ParquetFile(output_parquet).metadata
+    assert metadata.row_group(0).column(1).compression == expected, f"Parquet file should use {expected}."
+
+
+def test_fasta_command_compression_level_unsupported(
+    runner: CliRunner,
+    sample_fasta_file: Path,
+    tmp_path: Path,
+) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(
+        cli_main,
+        [
+            "fasta",
+            str(sample_fasta_file),
+            "-o",
+            str(output_parquet),
+            "--compression",
+            "snappy",
+            "--compression-level",
+            "4",
+        ],
+    )
+    assert result.exit_code == 2, "CLI should exit with code 2 for an unsupported compression level."
+    assert "does not support setting a compression level" in result.output
+    assert not output_parquet.exists(), "Output Parquet should not be created."
+
+
+@pytest.mark.parametrize(("codec", "level"), [("gzip", "0"), ("gzip", "10"), ("zstd", "23")])
+def test_fasta_command_compression_level_out_of_range(
+    runner: CliRunner,
+    sample_fasta_file: Path,
+    tmp_path: Path,
+    codec: str,
+    level: str,
+) -> None:
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(
+        cli_main,
+        [
+            "fasta",
+            str(sample_fasta_file),
+            "-o",
+            str(output_parquet),
+            "--compression",
+            codec,
+            "--compression-level",
+            level,
+        ],
+    )
+    assert result.exit_code == 2, "CLI should exit with code 2 for an out-of-range compression level."
+    assert f"Compression level for '{codec}' must be between" in result.output
+    assert not output_parquet.exists(), "Output Parquet should not be created."
+
+
+def test_fasta_command_hf_upload_path(
+    runner: CliRunner,
+    sample_fasta_file: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    uploaded = []
+    monkeypatch.setattr(
+        "bio2parquet.cli._handle_hf_upload",
+        lambda dataset, repo_id, token: uploaded.append((dataset, repo_id, token)),
+    )
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(
+        cli_main,
+        ["fasta", str(sample_fasta_file), "-o", str(output_parquet), "--hf-repo-id", "user/repo", "--hf-token", "tok"],
+    )
+
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    assert pq.read_table(output_parquet).num_rows == 2, "Parquet file has incorrect number of rows."
+    assert len(uploaded) == 1, "Dataset should have been handed to the upload step once."
+    dataset, repo_id, token = uploaded[0]
+    assert (repo_id, token) == ("user/repo", "tok")
+    assert dataset[1]["sequence"] == "GATTACAGATTACA"
+
+
 def test_fasta_command_default_output(runner: CliRunner, sample_fasta_file: Path, tmp_path: Path) -> None:
     # Use isolated_filesystem to handle CWD changes
     with runner.isolated_filesystem(temp_dir=tmp_path) as td:
@@ -155,6 +342,15 @@ def test_fasta_command_wrong_file_type(runner: CliRunner, tmp_path: Path) -> Non
     assert "Input file must be a FASTA file" in result.output
 
 
+def test_fasta_command_uppercase_extension(runner: CliRunner, tmp_path: Path, sample_fasta_content: str) -> None:
+    upper_fasta_file = tmp_path / "TEST.FA"
+    upper_fasta_file.write_text(sample_fasta_content)
+    output_parquet = tmp_path / "output.parquet"
+    result = runner.invoke(cli_main, ["fasta", str(upper_fasta_file), "-o", str(output_parquet)])
+    assert result.exit_code == 0, f"CLI exited with error: {result.output}"
+    assert output_parquet.exists(), "Output Parquet file was not created."
+
+
 @pytest.mark.skip("Skipping empty fasta file test as the error format breaks gh ci.")
 def test_fasta_command_empty_fasta_file(runner: CliRunner, empty_fasta_file: Path) -> None:
     output_parquet = empty_fasta_file.with_suffix(".parquet")
@@ -181,3 +377,38 @@ def test_cli_version(runner: CliRunner) -> None:
 #     result = runner.invoke(main, ["fasta", str(sample_fasta_file), "--hf-repo-id", "test/repo"])
 #     assert result.exit_code == 1
 #     assert "Error: --hf-repo-id was provided, but --hf-token is missing" in result.output
+
+
+def test_print_error_formats_each_cause_once(capsys: pytest.CaptureFixture) -> None:
+    """Each exception in the cause chain is printed with its own traceback.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    error = RuntimeError("outer failure")
+    error.__cause__ = ValueError("inner failure")
+    print_error(error)
+
+    captured = capsys.readouterr()
+    assert "Underlying Cause" in captured.err
+    assert captured.err.count("ValueError: inner failure") == 1
+    assert captured.err.count("RuntimeError: outer failure") == 1
+
+
+def test_print_error_limits_cause_depth(capsys: pytest.CaptureFixture) -> None:
+    """Only the first ``_MAX_CAUSE_DEPTH`` exceptions of a long cause chain are printed.
+
+    Parameters:
+        capsys: Pytest fixture to capture output.
+    """
+    error = ValueError("failure 0")
+    current = error
+    for i in range(1, _MAX_CAUSE_DEPTH + 5):
+        current.__cause__ = ValueError(f"failure {i}")
+        current = current.__cause__
+    print_error(error)
+
+    captured = capsys.readouterr()
+    assert captured.err.count("An error occurred") == _MAX_CAUSE_DEPTH
+    assert f"An error occurred: failure {_MAX_CAUSE_DEPTH - 1}\n" in captured.err
+    assert f"An error occurred: failure {_MAX_CAUSE_DEPTH}\n" not in captured.err
@@ -1,10 +1,16 @@
+import errno
+import gzip
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pyarrow as pa
 import pytest
 from datasets import Dataset
 
+from bio2parquet import fasta
 from bio2parquet.errors import FileProcessingError, InvalidFormatError
-from bio2parquet.fasta import create_dataset_from_fasta, read_fasta_file
+from bio2parquet.fasta import create_dataset_from_fasta, read_fasta_batches, read_fasta_file
 
 
 @pytest.fixture
@@ -18,11 +24,9 @@ def sample_fasta_file(tmp_path: Path) -> Path:
 
 @pytest.fixture
 def sample_fasta_gz_file(tmp_path: Path, sample_fasta_file: Path) -> Path:
-    import gzip
-
     gz_file_path = tmp_path / "test.fasta.gz"
-    with open(sample_fasta_file, "rb") as f_in, gzip.open(gz_file_path, "wb") as f_out:
-        f_out.write(f_in.read())
+    # The fastest compression level is enough for test data.
+    gz_file_path.write_bytes(gzip.compress(sample_fasta_file.read_bytes(), compresslevel=1))
     assert gz_file_path.exists(), "Test gzipped FASTA file was not created."
     return gz_file_path
 
@@ -116,6 +120,23 @@ def test_create_dataset_from_empty_fasta(empty_fasta_file: Path) -> None:
     assert "File is empty: no FASTA records found." in str(excinfo.value), "Incorrect error for empty FASTA file."
 
 
+def test_read_fasta_file_symlink_loop(tmp_path: Path) -> None:
+    file_path = tmp_path / "loop.fasta"
+    file_path.symlink_to(file_path)
+    with pytest.raises(FileProcessingError, match="Input file does not exist"):
+        list(read_fasta_file(file_path))
+
+
+def test_read_fasta_file_stat_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_stat(path: Path) -> None:
+        raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+    monkeypatch.setattr("bio2parquet.fasta.os.stat", fail_stat)
+    with pytest.raises(FileProcessingError, match="Cannot access input file") as excinfo:
+        list(read_fasta_file(tmp_path / "locked.fasta"))
+    assert "Permission denied" in str(excinfo.value), "The OS error should be reported, not a missing file."
+
+
 def test_create_dataset_from_fasta_non_existent() -> None:
     with pytest.raises(FileProcessingError) as excinfo:
         create_dataset_from_fasta(Path("non_existent_file.fasta"))
@@ -139,3 +160,211 @@ def test_fasta_assertions() -> None:
 
     with pytest.raises(FileProcessingError, match="Input path is not a file"):
         create_dataset_from_fasta(Path("."))  # Current directory
+
+
+def test_read_fasta_file_invalid_gzip(tmp_path: Path) -> None:
+    fake_gz_file = tmp_path / "not_gzipped.fasta.gz"
+    fake_gz_file.write_text(">Seq1\nATGC\n")
+    with pytest.raises(FileProcessingError, match="File is not a valid GZIP file"):
+        list(read_fasta_file(fake_gz_file))
+
+
+def test_read_fasta_file_truncated_gzip(tmp_path: Path, sample_fasta_gz_file: Path) -> None:
+    truncated_file = tmp_path / "truncated.fasta.gz"
+    truncated_file.write_bytes(sample_fasta_gz_file.read_bytes()[:-8])
+    with pytest.raises(FileProcessingError, match="Error reading file"):
+        list(read_fasta_file(truncated_file))
+
+
+def test_read_fasta_file_matches_biopython(tmp_path: Path) -> None:
+    content = ">Seq1 first record\r\nATGC ATGC\r\n\r\nCGTA\r\n>Seq2\tsecond\nGATTACA\n  \n>Seq3\nCC\tCC\nGGGG"
+    file_path = tmp_path / "tricky.fasta"
+    file_path.write_bytes(content.encode())
+
+    records = list(read_fasta_file(file_path))
+    assert records == list(read_fasta_file(file_path, use_biopython=True)), "Parser disagrees with Bio.SeqIO."
+    assert records == [
+        {"header": "Seq1", "sequence": "ATGCATGCCGTA"},
+        {"header": "Seq2", "sequence": "GATTACA"},
+        {"header": "Seq3", "sequence": "CCCCGGGG"},
+    ]
+
+    # Classic Mac OS line endings: bare carriage returns and no line feed at all
+    cr_path = tmp_path / "cr_only.fasta"
+    cr_path.write_bytes(b">s1\rACGT\rAC\r>s2 second\rGG\r")
+    cr_gz_path = tmp_path / "cr_only.fasta.gz"
+    cr_gz_path.write_bytes(gzip.compress(cr_path.read_bytes(), compresslevel=1))
+    for path in (cr_path, cr_gz_path):
+        cr_records = list(read_fasta_file(path))
+        assert cr_records == list(read_fasta_file(path, use_biopython=True)), "Parser disagrees with Bio.SeqIO."
+        assert cr_records == [{"header": "s1", "sequence": "ACGTAC"}, {"header": "s2", "sequence": "GG"}]
+
+
+def test_read_fasta_file_bare_cr_across_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Tiny reads, so that lines and CRLF pairs straddle the sniffed prefix and the blocks
+    monkeypatch.setattr("bio2parquet.fasta._SNIFF_SIZE", 14)
+    monkeypatch.setattr("bio2parquet.fasta._READ_BUFFER_SIZE", 5)
+    file_path = tmp_path / "cr_blocks.fasta"
+    file_path.write_bytes(b">s1 first\r" + b"ACGTACGTAC\r" * 3 + b">s2\r\nGG\r\n\r>s3\rT")
+
+    assert list(read_fasta_file(file_path)) == [
+        {"header": "s1", "sequence": "ACGTACGTAC" * 3},
+        {"header": "s2", "sequence": "GG"},
+        {"header": "s3", "sequence": "T"},
+    ]
+
+
+def test_read_fasta_file_whitespace_before_first_header(tmp_path: Path) -> None:
+    file_path = tmp_path / "indented.fasta"
+    file_path.write_text(" >Seq1\nACGT\n>Seq2\nGGGG\n")
+    with pytest.raises(InvalidFormatError, match="Sequence data found before a header line"):
+        list(read_fasta_file(file_path))
+
+
+def test_read_fasta_file_biopython_gzip_single_prefetch_thread(tmp_path: Path) -> None:
+    # Large enough that a prefetch thread is still blocked on its queue after the first record
+    content = ">Seq1\nACGT\n>Seq2\n" + ("ACGT" * 20 + "\n") * 100_000
+    file_path = tmp_path / "large.fasta.gz"
+    file_path.write_bytes(gzip.compress(content.encode(), compresslevel=1))
+
+    records = read_fasta_file(file_path, use_biopython=True)
+    assert next(records) == {"header": "Seq1", "sequence": "ACGT"}
+    prefetch_threads = [thread for thread in threading.enumerate() if thread.name == "bio2parquet-prefetch"]
+    records.close()
+    assert len(prefetch_threads) == 1, "The validation handle should be closed before Bio.SeqIO reopens the file."
+
+
+def test_read_fasta_file_missing_header_id(tmp_path: Path) -> None:
+    file_path = tmp_path / "no_id.fasta"
+    file_path.write_text(">Seq1\nATGC\n>\nGATTACA\n")
+    with pytest.raises(InvalidFormatError, match="Header missing for sequence"):
+        list(read_fasta_file(file_path))
+
+
+def test_create_dataset_from_fasta_schema(sample_fasta_file: Path) -> None:
+    dataset = create_dataset_from_fasta(sample_fasta_file)
+    assert dataset.features["header"].dtype == "string", "Headers should be stored as strings."
+    assert dataset.features["sequence"].dtype == "large_string", "Sequences should be stored as large strings."
+
+
+def test_create_dataset_from_fasta_skips_table_hashing(
+    sample_fasta_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def no_hashing(dataset: Dataset) -> None:
+        raise AssertionError(f"The table should not be pickled to fingerprint a {len(dataset)}-row dataset.")
+
+    monkeypatch.setattr("datasets.arrow_dataset.generate_fingerprint", no_hashing)
+    assert create_dataset_from_fasta(sample_fasta_file).num_rows == 3
+
+
+@pytest.fixture
+def large_fasta_file(tmp_path: Path) -> Path:
+    # Several MiB so that the parallel reader actually splits the file into ranges.
+    lines = []
+    for i in range(40_000):
+        lines.append(f">Seq{i} record {i}")
+        lines.extend(["ACGT" * 15, "TTGCA" * 10])
+    file_path = tmp_path / "large.fasta"
+    file_path.write_text("\n".join(lines) + "\n")
+    return file_path
+
+
+def test_create_dataset_from_fasta_parallel(large_fasta_file: Path) -> None:
+    sequential = create_dataset_from_fasta(large_fasta_file)
+    parallel = create_dataset_from_fasta(large_fasta_file, max_workers=4)
+
+    assert len(parallel) == 40_000, "Parallel dataset has incorrect number of rows."
+    assert parallel["header"] == sequential["header"], "Parallel parsing changed the record order or headers."
+    assert parallel["sequence"] == sequential["sequence"], "Parallel parsing changed the sequences."
+
+
+def test_create_dataset_from_fasta_parallel_bounded_ranges(
+    large_fasta_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    range_sizes = []
+    parse_range = fasta._parse_fasta_range
+
+    def record_range(path_str: str, start: int, end: int) -> list[pa.RecordBatch]:
+        range_sizes.append(end - start)
+        return parse_range(path_str, start, end)
+
+    # Threads instead of processes, so the ranges handed to workers can be recorded
+    monkeypatch.setattr("bio2parquet.fasta.ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr("bio2parquet.fasta._parse_fasta_range", record_range)
+    monkeypatch.setattr("bio2parquet.fasta._MAX_PARALLEL_RANGE_SIZE", 1 << 20)
+    dataset = create_dataset_from_fasta(large_fasta_file, max_workers=2)
+
+    assert len(range_sizes) > 2, "Large files should be split into more ranges than workers."
+    assert max(range_sizes) < 2 << 20, "Ranges should stay close to the maximum range size."
+    assert dataset["header"] == create_dataset_from_fasta(large_fasta_file)["header"]
+
+
+def test_create_dataset_from_fasta_parallel_error(large_fasta_file: Path) -> None:
+    with large_fasta_file.open("a") as handle:
+        handle.write(">Broken\n")
+    with pytest.raises(InvalidFormatError, match="Sequence missing for header"):
+        create_dataset_from_fasta(large_fasta_file, max_workers=4)
+
+
+def test_create_dataset_from_fasta_parallel_single_record(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file_path = tmp_path / "chromosome.fasta"
+    file_path.write_text(">chr1\n" + ("ACGT" * 15 + "\n") * 50_000)
+
+    def no_pool(max_workers: int) -> None:
+        raise AssertionError(f"A file without a split point should not start {max_workers} worker process(es).")
+
+    monkeypatch.setattr("bio2parquet.fasta.ProcessPoolExecutor", no_pool)
+    dataset = create_dataset_from_fasta(file_path, max_workers=4)
+    assert dataset["header"] == ["chr1"]
+    assert len(dataset["sequence"][0]) == 60 * 50_000
+
+
+def test_read_fasta_file_rapidgzip(sample_fasta_gz_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("rapidgzip")
+    monkeypatch.setattr("bio2parquet.fasta._PARALLEL_GZIP_MIN_SIZE", 0)
+    records = list(read_fasta_file(sample_fasta_gz_file))
+    assert [record["header"] for record in records] == ["Seq1;info1", "Seq2;info2", "Seq3;info3"]
+
+
+def test_read_fasta_file_rapidgzip_invalid_gzip(
+    tmp_path: Path,
+    sample_fasta_gz_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("rapidgzip")
+    monkeypatch.setattr("bio2parquet.fasta._PARALLEL_GZIP_MIN_SIZE", 0)
+
+    fake_gz_file = tmp_path / "not_gzipped.fasta.gz"
+    fake_gz_file.write_text(">Seq1\nATGC\n")
+    with pytest.raises(FileProcessingError, match="File is not a valid GZIP file"):
+        list(read_fasta_file(fake_gz_file))
+
+    content = sample_fasta_gz_file.read_bytes()
+    for cut in (8, len(content) // 2):
+        truncated_file = tmp_path / "truncated.fasta.gz"
+        truncated_file.write_bytes(content[:-cut])
+        with pytest.raises(FileProcessingError, match="Error reading file"):
+            list(read_fasta_file(truncated_file))
+
+
+def test_read_fasta_batches(sample_fasta_file: Path) -> None:
+    batches = list(read_fasta_batches(sample_fasta_file, batch_size=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 1], "Records should be split into batches of batch_size."
+    assert batches[0].schema.field("sequence").type == pa.large_string(), "Sequences should be large strings."
+    assert batches[0].column("header").to_pylist() == ["Seq1;info1", "Seq2;info2"]
+    assert batches[1].column("sequence").to_pylist() == ["CCCCGGGGTTTTAAAA"]
+
+
+def test_public_readers_accept_str_paths(sample_fasta_file: Path) -> None:
+    path = str(sample_fasta_file)
+    assert list(read_fasta_file(path)) == list(read_fasta_file(sample_fasta_file))
+    assert sum(batch.num_rows for batch in read_fasta_batches(path)) == 3
+    assert create_dataset_from_fasta(path).num_rows == 3
+
+
+def test_read_fasta_batches_non_existent() -> None:
+    with pytest.raises(FileProcessingError, match="Input file does not exist"):
+        next(read_fasta_batches(Path("non_existent_file.fasta")))